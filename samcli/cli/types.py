@@ -5,6 +5,7 @@ Implementation of custom click parameter types
 import json
 import logging
 import re
+from functools import cached_property
 from json import JSONDecodeError
 from typing import Dict, List, Optional, Union
 
@@ -58,9 +59,57 @@ def _unquote_wrapped_quotes(value):
     if value and value[0] == value[-1] and value[0] in ('"', "'") and value[-1] in ('"', "'"):
         value = value[1:-1]
 
+    # Nothing is escaped without a backslash, which is the common case
+    if "\\" not in value:
+        return value
+
     return value.replace("\\ ", " ").replace('\\"', '"').replace("\\'", "'")
 
 
+def _unquote_wrapped_quotes_memoized(value, memo):
+    """
+    Same as `_unquote_wrapped_quotes`, but reuses results stored in the given memo dictionary.
+    Used while converting a single option value, where the same keys and values tend to repeat.
+
+    Parameters
+    ----------
+    value : str
+        Input to unquote
+    memo : dict
+        Mapping of already unquoted inputs to their results, updated in place
+
+    Returns
+    -------
+    Unquoted string
+    """
+    unquoted = memo.get(value)
+    if unquoted is None:
+        unquoted = memo[value] = _unquote_wrapped_quotes(value)
+    return unquoted
+
+
+def _iter_values(value):
+    """
+    Normalizes the value received by a multi-value option type into a sequence of values.
+    The value is a tuple when it comes from the command line, a string or a list when it comes
+    from a configuration file, and the option's default (e.g. an empty dict) when it is omitted.
+
+    Parameters
+    ----------
+    value : Union[str, list, tuple, dict]
+        Value received by the option type
+
+    Returns
+    -------
+    Iterable of values to convert, empty if only an empty string was given
+    """
+    if value == ("",):
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return value
+
+
 class CfnParameterOverridesType(click.ParamType):
     """
     Custom Click options type to accept values for CloudFormation template parameters. You can pass values for
@@ -82,35 +131,34 @@ class CfnParameterOverridesType(click.ParamType):
     _pattern_1 = r"(?:ParameterKey={key},ParameterValue={value})".format(
         key=PARAM_AND_METADATA_KEY_REGEX, value=VALUE_REGEX_SPACE_DELIM
     )
-    _pattern_2 = r"(?:(?: ){key}={value})".format(key=PARAM_AND_METADATA_KEY_REGEX, value=VALUE_REGEX_SPACE_DELIM)
-
-    ordered_pattern_match = [_pattern_1, _pattern_2]
+    _pattern_2 = r"(?:(?:^| ){key}={value})".format(key=PARAM_AND_METADATA_KEY_REGEX, value=VALUE_REGEX_SPACE_DELIM)
 
     name = "string,list"
 
+    # Patterns are compiled on first use, which keeps that cost out of importing this module
+    @cached_property
+    def _compiled_pattern_1(self):
+        return re.compile(self._pattern_1)
+
+    @cached_property
+    def _compiled_pattern_2(self):
+        return re.compile(self._pattern_2)
+
     def convert(self, value, param, ctx):
         result = {}
+        unquote_memo: Dict[str, str] = {}
 
-        # Empty tuple
-        if value == ("",):
-            return result
+        for val in _iter_values(value):
+            normalized_val = val.strip()
 
-        value = (value,) if isinstance(value, str) else value
-        for val in value:
-            # Add empty string to start of the string to help match `_pattern2`
-            normalized_val = " " + val.strip()
-
-            try:
-                # NOTE(TheSriram): find the first regex that matched.
-                # pylint is concerned that we are checking at the same `val` within the loop,
-                # but that is the point, so disabling it.
-                pattern = next(
-                    i
-                    for i in filter(
-                        lambda item: re.findall(item, normalized_val), self.ordered_pattern_match
-                    )  # pylint: disable=cell-var-from-loop
-                )
-            except StopIteration:
+            # `_pattern_1` takes precedence, it can only match if the value contains its literal "ParameterKey=",
+            # so in the common case a single regex runs over the value.
+            groups = []
+            if "ParameterKey=" in normalized_val:
+                groups = self._compiled_pattern_1.findall(normalized_val)
+            if not groups:
+                groups = self._compiled_pattern_2.findall(normalized_val)
+            if not groups:
                 return self.fail(
                     "{} is not in valid format. It must look something like '{}' or '{}'".format(
                         val, self.__EXAMPLE_1, self.__EXAMPLE_2
@@ -119,11 +167,11 @@ class CfnParameterOverridesType(click.ParamType):
                     ctx,
                 )
 
-            groups = re.findall(pattern, normalized_val)
-
             # 'groups' variable is a list of tuples ex: [(key1, value1), (key2, value2)]
             for key, param_value in groups:
-                result[_unquote_wrapped_quotes(key)] = _unquote_wrapped_quotes(param_value)
+                result[_unquote_wrapped_quotes_memoized(key, unquote_memo)] = _unquote_wrapped_quotes_memoized(
+                    param_value, unquote_memo
+                )
 
         return result
 
@@ -142,30 +190,40 @@ class CfnMetadataType(click.ParamType):
 
     name = "string"
 
+    # Pattern is compiled on first use, which keeps that cost out of importing this module
+    @cached_property
+    def _compiled_pattern(self):
+        return re.compile(self._pattern)
+
     def convert(self, value, param, ctx):
         result = {}
         fail = False
         if not value:
             return result
-        try:
-            # Look to load the value into json if we can.
-            result = json.loads(value)
-            for val in result.values():
-                if isinstance(val, (dict, list)):
-                    # Need a non nested dictionary or a dictionary with non list values,
-                    # If either is found, fail the conversion.
-                    fail = True
-        except JSONDecodeError:
+        is_json = False
+        # Only a json object is accepted, so skip the json parser for anything that does not look like one.
+        if value.lstrip().startswith("{"):
+            try:
+                # Look to load the value into json if we can.
+                result = json.loads(value)
+                is_json = True
+                for val in result.values():
+                    if isinstance(val, (dict, list)):
+                        # Need a non nested dictionary or a dictionary with non list values,
+                        # If either is found, fail the conversion.
+                        fail = True
+            except JSONDecodeError:
+                pass
+
+        if not is_json:
             # if looking for a json format failed, look at if the specified value follows
             # KeyName1=string,KeyName2=string format
-            groups = re.findall(self._pattern, value)
+            for match in self._compiled_pattern.finditer(value):
+                # assign to result['KeyName1'] = string and so on.
+                result[match.group(1)] = match.group(2)
 
-            if not groups:
+            if not result:
                 fail = True
-            for group in groups:
-                key, v = group
-                # assign to result['KeyName1'] = string and so on.
-                result[key] = v
 
         if fail:
             return self.fail(
@@ -195,35 +253,46 @@ class CfnTags(click.ParamType):
 
     _pattern = r"{tag}={tag}".format(tag=_generate_match_regex(match_pattern=TAG_REGEX, delim=" "))
     _quoted_pattern = _generate_match_regex(match_pattern=TAG_REGEX)
+    _QUOTE_AND_ESCAPE_CHARACTERS = ('"', "'", "\\")
 
     name = "string,list"
 
+    # Patterns are compiled on first use, which keeps that cost out of importing this module
+    @cached_property
+    def _compiled_pattern(self):
+        return re.compile(self._pattern)
+
+    @cached_property
+    def _compiled_quoted_pattern(self):
+        return re.compile(self._quoted_pattern)
+
     def convert(self, value, param, ctx):
         result = {}
+        unquote_memo: Dict[str, str] = {}
         fail = False
-        # Empty tuple
-        if value == ("",):
-            return result
-
-        # if value comes in via samconfig file and is a list, it is parsed to string.
-        if isinstance(value, list):
-            if not value:
-                return result
-            value = tuple(value)
-        # if value comes in a via configuration file, it will be a string. So we should still convert it.
-        value = (value,) if not isinstance(value, tuple) else value
 
-        for val in value:
+        for val in _iter_values(value):
             # Using standard parser first.
             # We should implement other type parser like JSON and Key=key,Value=val type format.
             parsed, tags = self._standard_key_value_parser(val)
             if not parsed:
-                parsed, tags = self._space_separated_key_value_parser(val)
-            if parsed:
+                tags = self._multiple_space_separated_key_value_parser(val, separator=" ")
+            is_quoted = any(char in val for char in self._QUOTE_AND_ESCAPE_CHARACTERS)
+            if tags is None and not is_quoted:
+                # Without quotes or escapes there is nothing to unquote or to protect from splitting,
+                # so the value can be split on any whitespace before resorting to the regex.
+                tags = self._multiple_space_separated_key_value_parser(val)
+            if tags is not None:
                 for k in tags:
-                    self._add_value(result, _unquote_wrapped_quotes(k), _unquote_wrapped_quotes(tags[k]))
+                    self._add_value(
+                        result,
+                        _unquote_wrapped_quotes_memoized(k, unquote_memo),
+                        _unquote_wrapped_quotes_memoized(tags[k], unquote_memo),
+                    )
+            elif is_quoted:
+                fail = not self._parse_key_value_pair(result, val, unquote_memo)
             else:
-                fail = not self._parse_key_value_pair(result, val)
+                fail = not self._regex_key_value_parser(result, val, unquote_memo)
 
             if fail:
                 return self.fail(
@@ -234,7 +303,7 @@ class CfnTags(click.ParamType):
 
         return result
 
-    def _parse_key_value_pair(self, result: dict, key_value_string: str):
+    def _parse_key_value_pair(self, result: dict, key_value_string: str, unquote_memo: Dict[str, str]):
         """
         This method processes a string in the format "'key1'='value1','key2'='value2'",
         where spaces may exist within keys or values.
@@ -255,42 +324,70 @@ class CfnTags(click.ParamType):
         ----------
         result: result dict
         key_value_string: string to parse
+        unquote_memo: memo of already unquoted strings, shared across a single `convert` call
 
         Returns
         -------
         boolean - parse result
         """
-        parse_result = True
-
         # Unquote an entire string
         modified_val = _unquote_wrapped_quotes(key_value_string)
 
-        # Looking for a quote strings that contain spaces and proceed to replace them
-        quoted_strings_with_spaces = re.findall(self._quoted_pattern, modified_val)
-        quoted_strings_with_spaces_objects = [
-            TextWithSpaces(str_with_spaces) for str_with_spaces in quoted_strings_with_spaces
-        ]
-        for s, replacement in zip(quoted_strings_with_spaces, quoted_strings_with_spaces_objects):
-            modified_val = modified_val.replace(s, replacement.replace_spaces())
+        text_objects_by_modified_text: Dict[str, TextWithSpaces] = {}
+
+        # Quoted strings can only contain spaces if the string has both, otherwise there is nothing to replace
+        if " " in modified_val and ('"' in modified_val or "'" in modified_val):
+
+            def _replace_spaces(match):
+                text_object = TextWithSpaces(match.group(0))
+                modified_text = text_object.replace_spaces()
+                # Index the replaced strings by their modified text, keeping the first occurrence of each
+                text_objects_by_modified_text.setdefault(modified_text, text_object)
+                return modified_text
+
+            # Looking for a quote strings that contain spaces and replace them in a single pass
+            modified_val = self._compiled_quoted_pattern.sub(_replace_spaces, modified_val)
 
         # Use default parser to parse key=value
         tags = self._multiple_space_separated_key_value_parser(modified_val)
         if tags is not None:
             for key, value in tags.items():
-                new_value = value
-                text_objects = [obj for obj in quoted_strings_with_spaces_objects if obj.modified_text == value]
-                if len(text_objects) > 0:
-                    new_value = text_objects[0].restore_spaces()
-                self._add_value(result, _unquote_wrapped_quotes(key), _unquote_wrapped_quotes(new_value))
-        else:
-            # Otherwise, fall back to the original mechanism.
-            groups = re.findall(self._pattern, key_value_string)
+                text_object = text_objects_by_modified_text.get(value)
+                new_value = text_object.restore_spaces() if text_object else value
+                self._add_value(
+                    result,
+                    _unquote_wrapped_quotes_memoized(key, unquote_memo),
+                    _unquote_wrapped_quotes_memoized(new_value, unquote_memo),
+                )
+            return True
 
-            if not groups:
-                parse_result = False
-            for group in groups:
-                key, v = group
-                self._add_value(result, _unquote_wrapped_quotes(key), _unquote_wrapped_quotes(v))
+        # Otherwise, fall back to the original mechanism.
+        return self._regex_key_value_parser(result, key_value_string, unquote_memo)
+
+    def _regex_key_value_parser(self, result: dict, key_value_string: str, unquote_memo: Dict[str, str]):
+        """
+        Parses a string against the comprehensive {tag}={tag} regex pattern and adds the found
+        key-value pairs to the result.
+
+        Parameters
+        ----------
+        result: result dict
+        key_value_string: string to parse
+        unquote_memo: memo of already unquoted strings, shared across a single `convert` call
+
+        Returns
+        -------
+        boolean - parse result
+        """
+        parse_result = False
+
+        for match in self._compiled_pattern.finditer(key_value_string):
+            parse_result = True
+            self._add_value(
+                result,
+                _unquote_wrapped_quotes_memoized(match.group(1), unquote_memo),
+                _unquote_wrapped_quotes_memoized(match.group(2), unquote_memo),
+            )
 
         return parse_result
 
@@ -299,11 +396,9 @@ class CfnTags(click.ParamType):
         Add a given value to a given key in the result map.
         """
         if self.multiple_values_per_key:
-            if not result.get(key):
-                result[key] = []
-            result[key].append(new_value)
-            return
-        result[key] = new_value
+            result.setdefault(key, []).append(new_value)
+        else:
+            result[key] = new_value
 
     @staticmethod
     def _standard_key_value_parser(tag_value):
@@ -318,39 +413,24 @@ class CfnTags(click.ParamType):
         -------
 
         """
-        equals_count = tag_value.count("=")
-        if equals_count != 1:
+        key, separator, value = tag_value.partition("=")
+        if not separator or "=" in value:
             return False, None
 
-        splits = tag_value.split("=")
-        return True, {splits[0]: splits[1]}
+        return True, {key: value}
 
     @staticmethod
-    def _space_separated_key_value_parser(tag_value):
+    def _multiple_space_separated_key_value_parser(tag_value, separator=None):
         """
         Method to parse space separated `Key1=Value1 Key2=Value2` type tags without using regex.
         Parameters
         ----------
         tag_value
+        separator
+            Passed to str.split; the default splits on runs of whitespace
         """
         tags_dict = {}
-        for value in tag_value.split(" "):
-            parsed, parsed_tag = CfnTags._standard_key_value_parser(value)
-            if not parsed:
-                return False, None
-            tags_dict = {**tags_dict, **parsed_tag}
-        return True, tags_dict
-
-    @staticmethod
-    def _multiple_space_separated_key_value_parser(tag_value):
-        """
-        Method to parse space separated `Key1=Value1 Key2=Value2` type tags without using regex.
-        Parameters
-        ----------
-        tag_value
-        """
-        tags_dict = {}
-        for value in tag_value.split():
+        for value in tag_value.split(separator):
             parsed, parsed_tag = CfnTags._standard_key_value_parser(value)
             if not parsed:
                 return None
@@ -368,10 +448,15 @@ class SigningProfilesOptionType(click.ParamType):
     See convert function docs for details
     """
 
-    pattern = r"(?:(?: )([A-Za-z0-9\"]+)=(\"(?:\\.|[^\"\\]+)*\"|(?:\\.|[^ \"\\]+)+))"
+    pattern = r"(?:(?:^| )([A-Za-z0-9\"]+)=(\"(?:\\.|[^\"\\]+)*\"|(?:\\.|[^ \"\\]+)+))"
 
     name = "string"
 
+    # Pattern is compiled on first use, which keeps that cost out of importing this module
+    @cached_property
+    def _compiled_pattern(self):
+        return re.compile(self.pattern)
+
     def convert(self, value, param, ctx):
         """
         Converts given Signing Profile options to a dictionary where Function or Layer name would be key,
@@ -384,16 +469,10 @@ class SigningProfilesOptionType(click.ParamType):
         """
         result = {}
 
-        # Empty tuple
-        if value == ("",):
-            return result
-
-        value = (value,) if isinstance(value, str) else value
-        for val in value:
-            # Add empty string to start of the string to help match `_pattern2`
-            normalized_val = " " + val.strip()
+        for val in _iter_values(value):
+            normalized_val = val.strip()
 
-            signing_profiles = re.findall(self.pattern, normalized_val)
+            signing_profiles = self._compiled_pattern.findall(normalized_val)
 
             # if no signing profiles found by regex, then fail
             if not signing_profiles:
@@ -426,13 +505,13 @@ class SigningProfilesOptionType(click.ParamType):
 
     @staticmethod
     def _split_signer_profile_name_owner(signing_profile):
-        equals_count = signing_profile.count(":")
+        name, separator, owner = signing_profile.partition(":")
 
-        if equals_count > 1:
+        if not separator:
+            return signing_profile, ""
+        if ":" in owner:
             return None, None
-        if equals_count == 1:
-            return signing_profile.split(":")
-        return signing_profile, ""
+        return name, owner
 
 
 class ImageRepositoryType(click.ParamType):
@@ -440,35 +519,13 @@ class ImageRepositoryType(click.ParamType):
     Custom Parameter Type for Image Repository option.
     """
 
-    class Transformer:
-        """
-        Class takes in a converter (native click type) and a transformer.
-        transformer is a function callback where additional transformation happens before
-        conversion to a native click type.
-        """
-
-        def __init__(self, converter, transformation):
-            """
-
-            :param converter: native click Type
-            :param transformation: callback function for transformation prior to conversion.
-            """
-            self.converter = converter
-            self.transformer = transformation
-
-        def transform(self, *args, **kwargs):
-            return self.transformer(self.converter.convert(*args, **kwargs))
-
-    # Transformation callback function checks if the received option value is a valid ECR url.
-    transformer = Transformer(converter=click.STRING, transformation=is_ecr_url)
     name = "string"
 
     def convert(self, value, param, ctx):
         """
-        Attempt a conversion given the stipulations of allowed transformations.
+        Converts the value to a string and checks that it is a valid ECR url.
         """
-        result = self.transformer.transform(value, param, ctx)
-        if not result:
+        if not is_ecr_url(click.STRING.convert(value, param, ctx)):
             raise click.BadParameter(f"Invalid Image Repository ECR URI: {value}")
         return value
 
@@ -479,16 +536,13 @@ class ImageRepositoriesType(click.ParamType):
     """
 
     name = "list"
-    KEY_VALUE_PAIR_LENGTH = 2
 
     def convert(self, value, param, ctx):
-        key_value_pair = value.split("=")
-        if len(key_value_pair) != self.KEY_VALUE_PAIR_LENGTH:
+        key, separator, _value = value.partition("=")
+        if not separator or "=" in _value:
             raise click.BadParameter(
                 f"{param.opts[0]} is not a valid format, it needs to be of the form function_logical_id=ECR_URI"
             )
-        key = key_value_pair[0]
-        _value = key_value_pair[1]
         if not is_ecr_url(_value):
             raise click.BadParameter(f"{param.opts[0]} needs to have valid ECR URI as value")
         return {key: _value}
@@ -500,7 +554,6 @@ class RemoteInvokeBotoApiParameterType(click.ParamType):
     """
 
     name = "list"
-    MIN_KEY_VALUE_PAIR_LENGTH = 2
 
     def convert(self, value, param, ctx):
         """Converts the user provided parameter value with the format "parameter=value" to dict
@@ -513,13 +566,11 @@ class RemoteInvokeBotoApiParameterType(click.ParamType):
         ctx: Context
         """
         # Split by first "=" as some values could have multiple "=" For e.g. base-64 encoded ClientContext for Lambda
-        key_value_pair = value.split("=", 1)
-        if len(key_value_pair) < self.MIN_KEY_VALUE_PAIR_LENGTH:
+        key, separator, _value = value.partition("=")
+        if not separator:
             raise click.BadParameter(
                 f"{param.opts[0]} is not a valid format, it needs to be of the form parameter_key=parameter_value"
             )
-        key = key_value_pair[0]
-        _value = key_value_pair[1]
         LOG.debug("Converting provided %s option value to dict", param.opts[0])
         return {key: _value}
 
@@ -530,7 +581,6 @@ class DockerAdditionalHostType(click.ParamType):
     """
 
     name = "list"
-    MIN_KEY_VALUE_PAIR_LENGTH = 2
 
     def convert(self, value, param, ctx):
         """Converts the user provided parameters value with the format "host:IP" to dict
@@ -542,11 +592,9 @@ class DockerAdditionalHostType(click.ParamType):
         param: click parameter
         ctx: Context
         """
-        host_ip_pair = value.split(":", maxsplit=1)
-        if len(host_ip_pair) < self.MIN_KEY_VALUE_PAIR_LENGTH:
+        host, separator, ip = value.partition(":")
+        if not separator:
             raise click.BadParameter(f"{param.opts[0]} is not a valid format, it needs to be of the form hostname:IP")
-        host = host_ip_pair[0]
-        ip = host_ip_pair[1]
         LOG.debug("Converting provided %s option value to dict", param.opts[0])
         return {host: ip}
 
@@ -582,7 +630,6 @@ class SyncWatchExcludeType(click.ParamType):
 
     name = "list"
 
-    WATCH_EXCLUDE_EXPECTED_LENGTH = 2
     WATCH_EXCLUDE_DELIMITER = "="
 
     EXCEPTION_MESSAGE = "Argument must be a key, value pair in the format Key=Value."
@@ -610,9 +657,9 @@ class SyncWatchExcludeType(click.ParamType):
         if isinstance(value, dict):
             return value
 
-        mapping_pair = value.split(self.WATCH_EXCLUDE_DELIMITER)
+        resource_id, separator, excluded_path = value.partition(self.WATCH_EXCLUDE_DELIMITER)
 
-        if len(mapping_pair) != self.WATCH_EXCLUDE_EXPECTED_LENGTH:
+        if not separator or self.WATCH_EXCLUDE_DELIMITER in excluded_path:
             raise click.BadParameter(
                 param=param,
                 param_hint=f"'{value}'",
@@ -620,8 +667,6 @@ class SyncWatchExcludeType(click.ParamType):
                 message=self.EXCEPTION_MESSAGE,
             )
 
-        resource_id, excluded_path = mapping_pair
-
         if not (resource_id and excluded_path):
             raise click.BadParameter(
                 param=param,
@@ -637,28 +682,21 @@ class TextWithSpaces:
     def __init__(self, text) -> None:
         self.text = text
         self.modified_text = text
-        self.space_positions = []  # type: List[int]
 
     def replace_spaces(self, replacement="_"):
         """
-        Replace spaces in a text with a replacement together with its original locations.
+        Replace spaces in a text with a replacement, keeping the original text to restore from.
         Input: "test 1"
-        Output: "test_1" [4]
+        Output: "test_1"
         """
-        self.space_positions = [i for i, char in enumerate(self.text) if char == " "]
         self.modified_text = self.text.replace(" ", replacement)
 
         return self.modified_text
 
     def restore_spaces(self):
         """
-        Restore spaces in a text from a original space locations.
-        Input: "test_1" [4]
+        Restore spaces in a text by returning the original text.
+        Input: "test_1"
         Output: "test 1"
         """
-        text_list = list(self.modified_text)
-
-        for pos in self.space_positions:
-            text_list[pos] = " "
-
-        return "".join(text_list)
+        return self.text
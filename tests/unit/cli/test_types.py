@@ -1,7 +1,9 @@
 from unittest import TestCase
-from unittest.mock import MagicMock, Mock, ANY, patch
+from unittest.mock import MagicMock, Mock, ANY, PropertyMock, patch
 
+import click
 from click import BadParameter
+from click.testing import CliRunner
 from parameterized import parameterized
 
 from samcli.cli.types import (
@@ -22,6 +24,20 @@ class TestCfnParameterOverridesType(TestCase):
     def setUp(self):
         self.param_type = CfnParameterOverridesType()
 
+    def test_default_empty_dict(self):
+        # click passes the option's default when the option is omitted
+        self.assertEqual(self.param_type.convert({}, None, None), {})
+
+    def test_omitted_option_with_empty_dict_default(self):
+        @click.command()
+        @click.option("--parameter-overrides", type=self.param_type, default={})
+        def command(parameter_overrides):
+            click.echo(repr(parameter_overrides))
+
+        result = CliRunner().invoke(command, [])
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertEqual(result.output.strip(), "{}")
+
     @parameterized.expand(
         [
             # Random string
@@ -66,6 +82,8 @@ class TestCfnParameterOverridesType(TestCase):
                 {"KeyPairName": "MyKey", "InstanceType": "t1.micro"},
             ),
             (("KeyPairName=MyKey InstanceType=t1.micro",), {"KeyPairName": "MyKey", "InstanceType": "t1.micro"}),
+            (["KeyPairName=MyKey", "InstanceType=t1.micro"], {"KeyPairName": "MyKey", "InstanceType": "t1.micro"}),
+            ("KeyPairName=MyKey InstanceType=t1.micro", {"KeyPairName": "MyKey", "InstanceType": "t1.micro"}),
             (("KeyPairName=MyKey, InstanceType=t1.micro,",), {"KeyPairName": "MyKey,", "InstanceType": "t1.micro,"}),
             (('ParameterKey="Ke y",ParameterValue=Value',), {"ParameterKey": "Ke y"}),
             (("ParameterKey='Ke y',ParameterValue=Value",), {"ParameterKey": "Ke y"}),
@@ -149,6 +167,33 @@ class TestCfnParameterOverridesType(TestCase):
         result = self.param_type.convert(input, None, None)
         self.assertEqual(result, expected, msg="Failed with Input = " + str(input))
 
+    @parameterized.expand(
+        [
+            # Mixed formats, ParameterKey format takes precedence
+            (("ParameterKey=A,ParameterValue=B Foo=Bar",), {"A": "B"}),
+            (("Foo=Bar ParameterKey=A,ParameterValue=B",), {"A": "B"}),
+            (('ParameterKey=A,ParameterValue="B C"   Foo="Bar Baz"',), {"A": "B C"}),
+            # Multiple spaces between entries
+            (
+                ("ParameterKey=A,ParameterValue=B    ParameterKey=C,ParameterValue=D",),
+                {"A": "B", "C": "D"},
+            ),
+            (("Foo=Bar    Baz=Qux",), {"Foo": "Bar", "Baz": "Qux"}),
+            # ParameterKey format anywhere in the value takes precedence over Key=Value entries
+            (("Foo=ParameterKey=A,ParameterValue=B",), {"A": "B"}),
+            (('X="ParameterKey=A,ParameterValue=B"',), {"A": "B"}),
+            (('Key="ParameterKey=A,ParameterValue=B"',), {"A": "B"}),
+            (("a=b,ParameterKey=A,ParameterValue=B",), {"A": "B"}),
+            (("xParameterKey=A,ParameterValue=B",), {"A": "B"}),
+            (("Foo=Bar\tParameterKey=A,ParameterValue=B",), {"A": "B"}),
+            # Falls back to Key=Value when "ParameterKey=" is present but not in the ParameterKey format
+            (("ParameterKey=A",), {"ParameterKey": "A"}),
+        ]
+    )
+    def test_parsing_with_both_formats(self, input, expected):
+        result = self.param_type.convert(input, None, None)
+        self.assertEqual(result, expected, msg="Failed with Input = " + str(input))
+
 
 class TestCfnMetadataType(TestCase):
     def setUp(self):
@@ -188,6 +233,7 @@ class TestCfnMetadataType(TestCase):
             ("a=b,c=d", {"a": "b", "c": "d"}),
             ('{"a":"b"}', {"a": "b"}),
             ('{"a":"b", "c":"d"}', {"a": "b", "c": "d"}),
+            (' {"a":"b"}', {"a": "b"}),
             ("", {}),
         ]
     )
@@ -246,6 +292,9 @@ class TestCfnTags(TestCase):
                 ('tag1="son of anton" tag2="company abc" tag:3="dummy tag"',),
                 {"tag1": "son of anton", "tag2": "company abc", "tag:3": "dummy tag"},
             ),
+            # whitespace other than a single space stays part of the tag
+            (("a=b\t c=d",), {"a": "b\t", "c": "d"}),
+            (('a=b c\td=e"',), {"a": "b", "c\td": 'e"'}),
         ]
     )
     def test_successful_parsing(self, input, expected):
@@ -268,11 +317,25 @@ class TestCfnTags(TestCase):
             ),
         ]
     )
-    @patch("re.findall")
-    def test_no_regex_parsing_if_input_is_list(self, input, expected, regex_mock):
+    @patch("samcli.cli.types.CfnTags._compiled_quoted_pattern", new_callable=PropertyMock)
+    @patch("samcli.cli.types.CfnTags._compiled_pattern", new_callable=PropertyMock)
+    def test_no_regex_parsing_if_input_is_list(self, input, expected, regex_mock, quoted_regex_mock):
         result = self.param_type.convert(input, None, None)
         self.assertEqual(result, expected, msg="Failed with Input = " + str(input))
         regex_mock.assert_not_called()
+        quoted_regex_mock.assert_not_called()
+
+    @patch("samcli.cli.types.CfnTags._compiled_quoted_pattern", new_callable=PropertyMock)
+    def test_no_quoted_regex_parsing_if_input_has_no_quotes(self, quoted_regex_mock):
+        result = self.param_type.convert(("a==b c=d",), None, None)
+        self.assertEqual(result, {"a=": "b", "c": "d"})
+        quoted_regex_mock.assert_not_called()
+
+    @patch("samcli.cli.types.CfnTags._compiled_quoted_pattern", new_callable=PropertyMock)
+    def test_no_quoted_regex_parsing_if_input_has_no_spaces(self, quoted_regex_mock):
+        result = self.param_type.convert(('"a"="b"="c"',), None, None)
+        self.assertEqual(result, {"a": "b"})
+        quoted_regex_mock.assert_not_called()
 
 
 class TestCfnTagsMultipleValues(TestCase):
@@ -337,6 +400,20 @@ class TestCodeSignOptionType(TestCase):
     def setUp(self):
         self.param_type = SigningProfilesOptionType()
 
+    def test_default_empty_dict(self):
+        # click passes the option's default when the option is omitted
+        self.assertEqual(self.param_type.convert({}, None, None), {})
+
+    def test_omitted_option_with_empty_dict_default(self):
+        @click.command()
+        @click.option("--signing-profiles", type=self.param_type, default={})
+        def command(signing_profiles):
+            click.echo(repr(signing_profiles))
+
+        result = CliRunner().invoke(command, [])
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertEqual(result.output.strip(), "{}")
+
     @parameterized.expand(
         [
             # Just a string